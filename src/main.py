@@ -1,10 +1,81 @@
-from fastapi import FastAPI
+import functools
+from typing import Any
+
+import msgspec
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import HTMLResponse
 from routers.datasets import router as datasets_router
 from routers.mldcat_ap.dataset import router as mldcat_ap_router
+from routers.mldcat_ap.dataset import schema_components as mldcat_ap_schema_components
 from routers.old.datasets import router as datasets_router_old_format
 
-app = FastAPI()
+OPENAPI_URL = "/openapi.json"
+SWAGGER_UI_OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+
+# The OpenAPI routes are registered below, so the schema is encoded only once.
+app = FastAPI(openapi_url=None, swagger_ui_oauth2_redirect_url=SWAGGER_UI_OAUTH2_REDIRECT_URL)
 
 app.include_router(datasets_router)
 app.include_router(datasets_router_old_format)
 app.include_router(mldcat_ap_router)
+
+
+
+def _root_path(request: Request) -> str:
+    """The path prefix the app is served under, e.g. when behind a proxy."""
+    return str(request.scope.get("root_path", "")).rstrip("/")
+
+
+@functools.cache
+def _encoded_openapi_schema(root_path: str) -> bytes:
+    schema: dict[str, Any] = app.openapi()
+    # The MLDCAT-AP responses refer to msgspec-generated schemas, which FastAPI does not know.
+    components = schema.get("components", {})
+    schema = schema | {
+        "components": components
+        | {"schemas": components.get("schemas", {}) | mldcat_ap_schema_components},
+    }
+    # Like FastAPI, advertise the path prefix as the first server.
+    if root_path and app.root_path_in_servers:
+        servers = schema.get("servers", [])
+        if all(server.get("url") != root_path for server in servers):
+            schema = schema | {"servers": [{"url": root_path}, *servers]}
+    return msgspec.json.encode(schema)
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+def openapi_schema(request: Request) -> Response:
+    return Response(
+        content=_encoded_openapi_schema(_root_path(request)),
+        media_type="application/json",
+    )
+
+
+@app.get("/docs", include_in_schema=False)
+def swagger_ui(request: Request) -> HTMLResponse:
+    root_path = _root_path(request)
+    return get_swagger_ui_html(
+        openapi_url=root_path + OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=root_path + SWAGGER_UI_OAUTH2_REDIRECT_URL,
+        init_oauth=app.swagger_ui_init_oauth,
+        swagger_ui_parameters=app.swagger_ui_parameters,
+    )
+
+
+@app.get(SWAGGER_UI_OAUTH2_REDIRECT_URL, include_in_schema=False)
+def swagger_ui_oauth2_redirect() -> HTMLResponse:
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get("/redoc", include_in_schema=False)
+def redoc(request: Request) -> HTMLResponse:
+    return get_redoc_html(
+        openapi_url=_root_path(request) + OPENAPI_URL,
+        title=f"{app.title} - ReDoc",
+    )
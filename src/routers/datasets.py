@@ -17,7 +17,7 @@ from fastapi import APIRouter, HTTPException
 from schemas.datasets.openml import (
     DatasetFileFormat,
     DatasetMetadata,
-    DatasetStatus,
+    DatasetStatusValue,
     Visibility,
 )
 
@@ -127,7 +127,7 @@ def get_dataset(
     processing_result = _get_processing_information(dataset_id)
     status = get_latest_status_update(dataset_id)
 
-    status_ = DatasetStatus(status["status"]) if status else DatasetStatus.IN_PREPARATION
+    status_: DatasetStatusValue = status["status"] if status else "in_preparation"
 
     description_ = ""
     if description:
@@ -147,8 +147,9 @@ def get_dataset(
     #   $dataset->{$field} = getcsv( $dataset->{$field} );
     # }
 
-    return DatasetMetadata(
-        id=dataset["did"],
+    # All values come from our own database, so we skip validation of the model.
+    return DatasetMetadata.model_construct(
+        id_=dataset["did"],
         visibility=dataset["visibility"],
         status=status_,
         name=dataset["name"],
@@ -156,16 +157,16 @@ def get_dataset(
         version=dataset["version"],
         version_label=dataset["version_label"] or "",
         language=dataset["language"] or "",
-        creator=creators,
-        contributor=contributors,
+        creators=creators,
+        contributors=contributors,
         citation=dataset["citation"] or "",
         upload_date=dataset["upload_date"],
         processing_date=processing_result.date,
-        warning=processing_result.warning,
-        error=processing_result.error,
+        processing_warning=processing_result.warning,
+        processing_error=processing_result.error,
         description=description_,
         description_version=description["version"] if description else 0,
-        tag=tags,
+        tags=tags,
         default_target_attribute=_safe_unquote(dataset["default_target_attribute"]),
         ignore_attribute=ignore_attribute,
         row_id_attribute=row_id_attribute,
@@ -173,7 +174,7 @@ def get_dataset(
         parquet_url=parquet_url,
         minio_url=parquet_url,
         file_id=dataset["file_id"],
-        format=dataset["format"].lower(),
+        format_=dataset["format"].lower(),
         paper_url=dataset["paper_url"] or None,
         original_data_url=original_data_url,
         collection_date=dataset["collection_date"],
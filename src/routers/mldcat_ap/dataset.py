@@ -1,15 +1,81 @@
-from fastapi import APIRouter
-from schemas.datasets.mldcat_ap import JsonLDGraph, convert_to_mldcat_ap
+import http.client
+from typing import Annotated
+
+import msgspec
+from fastapi import APIRouter, Depends, Header, Response
+from schemas.datasets.mldcat_ap import JsonLDGraph, MediaType, encode_mldcat_ap
 
 from routers.datasets import get_dataset
 
 router = APIRouter(prefix="/mldcat_ap/datasets", tags=["datasets"])
 
+# FastAPI only documents Pydantic models, so the msgspec schema of the graph is added
+# to the responses. The referenced components are registered with the app's schema.
+(_json_ld_graph_schema,), schema_components = msgspec.json.schema_components(
+    [JsonLDGraph],
+    ref_template="#/components/schemas/{name}",
+)
+
+
+def _parse_accept(accept: str) -> dict[str, float]:
+    """Map each media range of an `Accept` header to its quality value."""
+    qualities: dict[str, float] = {}
+    for media_range in accept.split(","):
+        media_type, *parameters = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type:
+            qualities[media_type.lower()] = quality
+    return qualities
+
+
+def _negotiate_media_type(accept: Annotated[str | None, Header()] = None) -> MediaType:
+    """MessagePack is only served when explicitly preferred, e.g. by internal services.
+
+    JSON-LD is acceptable as `application/ld+json` or `application/json`, otherwise
+    through the most specific wildcard. MessagePack must be listed explicitly and have
+    at least the same quality.
+    """
+    if not accept:
+        return MediaType.JSON_LD
+    qualities = _parse_accept(accept)
+    msgpack_quality = qualities.get(MediaType.MSGPACK, 0.0)
+    json_qualities = [
+        qualities[media_range]
+        for media_range in (MediaType.JSON_LD, "application/json")
+        if media_range in qualities
+    ]
+    wildcard_quality = qualities.get("application/*", qualities.get("*/*", 0.0))
+    json_ld_quality = max(json_qualities) if json_qualities else wildcard_quality
+    if msgpack_quality > 0 and msgpack_quality >= json_ld_quality:
+        return MediaType.MSGPACK
+    return MediaType.JSON_LD
+
 
 @router.get(
     path="/{dataset_id}",
     description="Get meta-data for dataset with ID `dataset_id`.",
+    response_class=Response,
+    responses={
+        http.client.OK: {
+            "content": {MediaType.JSON_LD: {"schema": _json_ld_graph_schema}},
+        },
+    },
 )
-def get_mldcat_ap_dataset(dataset_id: int) -> JsonLDGraph:
+def get_mldcat_ap_dataset(
+    dataset_id: int,
+    media_type: Annotated[MediaType, Depends(_negotiate_media_type)],
+) -> Response:
     openml_dataset = get_dataset(dataset_id)
-    return convert_to_mldcat_ap(openml_dataset)
+    return Response(
+        content=encode_mldcat_ap(openml_dataset, media_type),
+        media_type=media_type,
+        # The body depends on the `Accept` header, so caches must not share it across types.
+        headers={"Vary": "Accept"},
+    )
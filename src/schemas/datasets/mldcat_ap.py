@@ -7,47 +7,78 @@ developed in collaboration with OpenML.
 """
 from __future__ import annotations
 
-from abc import ABC
+import dataclasses
+import functools
+from collections.abc import Hashable
 from enum import StrEnum
-from typing import Generic, Literal, TypeVar
+from typing import Annotated, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, Field, HttpUrl
+import msgspec
 
-from schemas.datasets.openml import DatasetMetadata, DatasetStatus, Visibility
+from schemas.datasets.openml import DatasetMetadata, DatasetStatusValue, VisibilityValue
 
+# URLs in the graph are built by the server itself, so the pattern is only enforced when
+# decoding and documents the expected format in the schema.
+HttpUrl = Annotated[str, msgspec.Meta(pattern=r"^https?://")]
 
-class JsonLDQualifiedLiteral(BaseModel):
-    """Base class for all JSON-LD objects"""
+MLDCAT_AP_CONTEXT = "https://semiceu.github.io/MLDCAT-AP/releases/1.0.0/context/mldcat-ap.jsonld"
+XSD_DATETIME = "http://www.w3.org/2001/XMLSchema#dateTime"
 
-    type_: str = Field(serialization_alias="@type")
-    value: str = Field(serialization_alias="@value")
+# Graphs only refer to each other by `@id`, they never form reference cycles.
+# Therefore, the structs need not be tracked by the garbage collector (`gc=False`).
+# Some objects are shared by all graphs and their cached encodings, so the structs
+# are immutable (`frozen=True`).
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
 
+class JsonLDQualifiedLiteral(
+    msgspec.Struct,
+    kw_only=True,
+    forbid_unknown_fields=True,
+    gc=False,
+    frozen=True,
+):
+    """Base class for all JSON-LD objects"""
 
-JsonLiteral = JsonLDQualifiedLiteral | str
+    type_: str = msgspec.field(name="@type")
+    value: str = msgspec.field(name="@value")
 
 
-class JsonLDObject(BaseModel, ABC):
-    """Base class for all JSON-LD objects"""
+JsonLiteral = JsonLDQualifiedLiteral | str
 
-    id_: str = Field(serialization_alias="@id")
-    type_: str = Field(serialization_alias="@type")
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
+class JsonLDObject(
+    msgspec.Struct,
+    kw_only=True,
+    forbid_unknown_fields=True,
+    gc=False,
+    frozen=True,
+    tag_field="@type",
+):
+    """Base class for all JSON-LD objects, its `@type` is the tag of the subclass."""
 
+    id_: str = msgspec.field(name="@id")
 
-T = TypeVar("T", bound=JsonLDObject)
 
+T = TypeVar("T", bound=JsonLDObject)
 
-class JsonLDObjectReference(BaseModel, Generic[T]):
-    id_: str = Field(serialization_alias="@id")
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
+class JsonLDObjectReference(
+    msgspec.Struct,
+    Generic[T],
+    kw_only=True,
+    forbid_unknown_fields=True,
+    gc=False,
+    frozen=True,
+):
+    id_: str = msgspec.field(name="@id")
 
     @classmethod
     def to(cls, json_ld_object: T) -> JsonLDObjectReference[T]:
-        """Create a reference to `json_ld_object`"""
+        """Create a reference to `json_ld_object`
+
+        The type parameter is inferred from `json_ld_object`, call this on the
+        unsubscripted class to avoid creating a generic alias at runtime.
+        """
         return cls(id_=json_ld_object.id_)
 
 
@@ -60,27 +91,27 @@ class AccessRights(StrEnum):
     NON_PUBLIC = "NON_PUBLIC"
 
 
-class Agent(JsonLDObject):
+class Agent(JsonLDObject, kw_only=True, tag="Agent"):
     """Any entity carrying out actions with respect to the (Core) entities Catalogue,
     Datasets, Data Services and Distributions. If the Agent is an organisation,
     the use of the Organization Ontology is recommended.
     """
 
-    type_: Literal["Agent"] = "Agent"
-    name: list[JsonLiteral] = Field(default_factory=list, min_length=1)
+    name: Annotated[list[JsonLiteral], msgspec.Meta(min_length=1)] = msgspec.field(
+        default_factory=list,
+    )
 
 
-class MD5Checksum(JsonLDObject):
+class MD5Checksum(JsonLDObject, kw_only=True, tag="Checksum"):
     """A value that allows the contents of a file to be authenticated.
     This class allows the results of a variety of checksum and cryptographic
     message digest algorithms to be represented.
     """
 
-    type_: Literal["Checksum"] = "Checksum"
     algorithm: Literal[
         "http://spdx.org/rdf/terms#checksumAlgorithm_md5"
     ] = "http://spdx.org/rdf/terms#checksumAlgorithm_md5"
-    value: str = Field(serialization_alias="checksumValue")
+    value: str = msgspec.field(name="checksumValue")
 
 
 class FeatureType(StrEnum):
@@ -88,203 +119,265 @@ class FeatureType(StrEnum):
     NUMERIC = "Numeric"
 
 
-class Feature(JsonLDObject):
-    type_: Literal["Feature"] = "Feature"
-    name: str = Field()
-    feature_type: FeatureType = Field(serialization_alias="type")
-    description: JsonLiteral | None = Field(default=None)
+class Feature(JsonLDObject, kw_only=True, tag="Feature"):
+    name: str
+    feature_type: FeatureType = msgspec.field(name="type")
+    description: JsonLiteral | None = None
 
 
-class QualityType(JsonLDObject):
-    type_: Literal["QualityType"] = "QualityType"
-    name: str = Field()
-    quality_id: str = Field(serialization_alias="id")
+class QualityType(JsonLDObject, kw_only=True, tag="QualityType"):
+    name: str
+    quality_id: str = msgspec.field(name="id")
 
 
-class Quality(JsonLDObject):
-    type_: Literal["Quality"] = "Quality"
-    quality_type: QualityType = Field(serialization_alias="type")
-    value: JsonLiteral = Field()
+class Quality(JsonLDObject, kw_only=True, tag="Quality"):
+    quality_type: QualityType = msgspec.field(name="type")
+    value: JsonLiteral
 
 
-class Distribution(JsonLDObject):
-    type_: Literal["Distribution"] = "Distribution"
-    # required
-    access_url: list[HttpUrl] = Field(
+# `DataService` refers to the `Dataset` it serves, this is the only forward reference
+# needed for the cycle `Dataset->Distribution->DataService->Dataset`.
+class DataService(JsonLDObject, kw_only=True, tag="DataService"):
+    endpoint_url: HttpUrl = msgspec.field(name="endpointUrl")
+    title: Annotated[list[JsonLiteral], msgspec.Meta(min_length=1)] = msgspec.field(
         default_factory=list,
-        min_length=1,
-        serialization_alias="accessUrl",
     )
-    has_feature: list[JsonLDObjectReference[Feature]] = Field(
+    serves_dataset: list[JsonLDObjectReference[Dataset]] = msgspec.field(
         default_factory=list,
-        serialization_alias="hasFeature",
-        min_length=1,
+        name="servesDataset",
     )
-    has_quality: list[JsonLDObjectReference[Quality]] = Field(
+
+
+class Distribution(JsonLDObject, kw_only=True, tag="Distribution"):
+    # required
+    access_url: Annotated[list[HttpUrl], msgspec.Meta(min_length=1)] = msgspec.field(
         default_factory=list,
-        serialization_alias="hasQuality",
-        min_length=1,
+        name="accessUrl",
     )
+    has_feature: Annotated[
+        list[JsonLDObjectReference[Feature]],
+        msgspec.Meta(min_length=1),
+    ] = msgspec.field(default_factory=list, name="hasFeature")
+    has_quality: Annotated[
+        list[JsonLDObjectReference[Quality]],
+        msgspec.Meta(min_length=1),
+    ] = msgspec.field(default_factory=list, name="hasQuality")
 
     # other
-    byte_size: JsonLiteral | None = Field(serialization_alias="byteSize", default=None)
-    default_target_attribute: JsonLiteral | None = Field(
-        serialization_alias="defaultTargetAttribute",
+    byte_size: JsonLiteral | None = msgspec.field(name="byteSize", default=None)
+    default_target_attribute: JsonLiteral | None = msgspec.field(
+        name="defaultTargetAttribute",
         default=None,
     )
-    download_url: list[HttpUrl] = Field(default_factory=list, serialization_alias="downloadUrl")
-    format_: JsonLiteral | None = Field(serialization_alias="format", default=None)
-    identifier: JsonLiteral | None = Field(default=None)
-    ignore_attribute: list[JsonLiteral] = Field(
+    download_url: list[HttpUrl] = msgspec.field(default_factory=list, name="downloadUrl")
+    format_: JsonLiteral | None = msgspec.field(name="format", default=None)
+    identifier: JsonLiteral | None = None
+    ignore_attribute: list[JsonLiteral] = msgspec.field(
         default_factory=list,
-        serialization_alias="ignoreAttirbute",
-    )
-    processing_error: JsonLiteral | None = Field(
-        serialization_alias="processingError",
-        default=None,
+        name="ignoreAttirbute",
     )
-    processing_warning: JsonLiteral | None = Field(
-        serialization_alias="processingWarning",
+    processing_error: JsonLiteral | None = msgspec.field(name="processingError", default=None)
+    processing_warning: JsonLiteral | None = msgspec.field(
+        name="processingWarning",
         default=None,
     )
-    processing_data: JsonLiteral | None = Field(serialization_alias="processingDate", default=None)
-    row_id_attribute: JsonLiteral | None = Field(serialization_alias="rowIDAttribute", default=None)
-    title: list[JsonLiteral] = Field(default_factory=list)
-    checksum: JsonLDObjectReference[MD5Checksum] | None = Field(default=None)
+    processing_data: JsonLiteral | None = msgspec.field(name="processingDate", default=None)
+    row_id_attribute: JsonLiteral | None = msgspec.field(name="rowIDAttribute", default=None)
+    title: list[JsonLiteral] = msgspec.field(default_factory=list)
+    checksum: JsonLDObjectReference[MD5Checksum] | None = None
 
-    access_service: list[JsonLDObjectReference[DataService]] = Field(
+    access_service: list[JsonLDObjectReference[DataService]] = msgspec.field(
         default_factory=list,
-        serialization_alias="accessService",
+        name="accessService",
     )
     # has_policy: Policy | None = Field(alias="hasPolicy")
     # language: list[LinguisticSystem] = Field(default_factory=list)
     # licence: LicenceDocument | None = Field()
 
 
-class Dataset(JsonLDObject):
-    type_: Literal["Dataset"] = "Dataset"
+class Dataset(JsonLDObject, kw_only=True, tag="Dataset"):
     # required
-    collection_date: JsonLiteral = Field(serialization_alias="collectionDate")
-    description: list[JsonLiteral] = Field(default_factory=list, min_length=1)
-    title: list[JsonLiteral] = Field(default_factory=list, min_length=1)
-
-    # other
-    access_rights: AccessRights | None = Field(serialization_alias="accessRights", default=None)
-    contributor: list[JsonLDObjectReference[Agent]] = Field(default_factory=list)
-    creator: Agent | None = Field(default=None)
-    distribution: list[JsonLDObjectReference[Distribution]] = Field(
+    collection_date: JsonLiteral = msgspec.field(name="collectionDate")
+    description: Annotated[list[JsonLiteral], msgspec.Meta(min_length=1)] = msgspec.field(
         default_factory=list,
     )
-    has_version: list[JsonLDObjectReference[Dataset]] = Field(
+    title: Annotated[list[JsonLiteral], msgspec.Meta(min_length=1)] = msgspec.field(
         default_factory=list,
-        serialization_alias="hasVersion",
     )
-    identifier: list[JsonLiteral] = Field(default_factory=list)
-    is_referenced_by: list[JsonLiteral] = Field(
+
+    # other
+    access_rights: AccessRights | None = msgspec.field(name="accessRights", default=None)
+    contributor: list[JsonLDObjectReference[Agent]] = msgspec.field(default_factory=list)
+    creator: Agent | None = None
+    distribution: list[JsonLDObjectReference[Distribution]] = msgspec.field(
         default_factory=list,
-        serialization_alias="isReferencedBy",
     )
-    is_version_of: list[JsonLDObjectReference[Dataset]] = Field(
+    has_version: list[JsonLDObjectReference[Dataset]] = msgspec.field(
         default_factory=list,
-        serialization_alias="isVersionOf",
+        name="hasVersion",
     )
-    issued: JsonLiteral | None = Field(default=None)
-    keyword: list[JsonLiteral] = Field(default_factory=list)
-    landing_page: list[JsonLiteral] = Field(default_factory=list, serialization_alias="landingPage")
-    publisher: JsonLDObjectReference[Agent] | None = Field(default=None)
-    status: DatasetStatus | None = Field(default=None)
-    version_info: JsonLiteral | None = Field(serialization_alias="versionInfo", default=None)
-    version_label: JsonLiteral | None = Field(serialization_alias="versionLabel", default=None)
-    visibility: Visibility | None = Field(default=None)
-
-
-class DataService(JsonLDObject):
-    type_: Literal["DataService"] = "DataService"
-    endpoint_url: HttpUrl = Field(serialization_alias="endpointUrl")
-    title: list[JsonLiteral] = Field(default_factory=list, min_length=1)
-    serves_dataset: list[JsonLDObjectReference[Dataset]] = Field(
+    identifier: list[JsonLiteral] = msgspec.field(default_factory=list)
+    is_referenced_by: list[JsonLiteral] = msgspec.field(
         default_factory=list,
-        serialization_alias="servesDataset",
+        name="isReferencedBy",
     )
-
-
-# We need at least one forward reference for type annotation in the cycle
-# `Dataset->Distribution->Dataservice->Dataset`, but this is not supported by
-# the OpenAI schema checker, so we need to explicitly update the references.
-Distribution.model_rebuild()
-
-
-class JsonLDGraph(BaseModel):
-    context: str | dict[str, HttpUrl] = Field(default_factory=dict, serialization_alias="@context")
+    is_version_of: list[JsonLDObjectReference[Dataset]] = msgspec.field(
+        default_factory=list,
+        name="isVersionOf",
+    )
+    issued: JsonLiteral | None = None
+    keyword: list[JsonLiteral] = msgspec.field(default_factory=list)
+    landing_page: list[JsonLiteral] = msgspec.field(default_factory=list, name="landingPage")
+    publisher: JsonLDObjectReference[Agent] | None = None
+    status: DatasetStatusValue | None = None
+    version_info: JsonLiteral | None = msgspec.field(name="versionInfo", default=None)
+    version_label: JsonLiteral | None = msgspec.field(name="versionLabel", default=None)
+    visibility: VisibilityValue | None = None
+
+
+class JsonLDGraph(
+    msgspec.Struct,
+    kw_only=True,
+    forbid_unknown_fields=True,
+    gc=False,
+    frozen=True,
+):
+    context: str | dict[str, HttpUrl] = msgspec.field(default_factory=dict, name="@context")
     graph: list[
         Distribution | DataService | Dataset | Quality | Feature | Agent | MD5Checksum
-    ] = Field(default_factory=list, serialization_alias="@graph")
-
-    model_config = {"populate_by_name": True, "extra": "forbid"}
+    ] = msgspec.field(default_factory=list, name="@graph")
+
+
+# Feature and quality information is not loaded yet, so every distribution refers to
+# the same examples. These objects do not depend on the dataset and are built once.
+_ARFF_SERVICE = DataService(
+    id_="openml-arff-service",
+    title=["OpenML ARFF server"],
+    endpoint_url="https://www.openml.org/data/download",
+)
+_EXAMPLE_FEATURE = Feature(
+    id_="example-petal-width",
+    name="example_petal_width",
+    feature_type=FeatureType.NUMERIC,
+    description="Feature information not loaded, this is an example.",
+)
+_EXAMPLE_QUALITY = Quality(
+    id_="example-quality",
+    quality_type=QualityType(
+        id_="quality-type-example",
+        name="number_of_features",
+        quality_id="link_to_definition",
+    ),
+    value="150",
+)
+_ARFF_SERVICE_REFERENCE = JsonLDObjectReference.to(_ARFF_SERVICE)
+_EXAMPLE_FEATURE_REFERENCE = JsonLDObjectReference.to(_EXAMPLE_FEATURE)
+_EXAMPLE_QUALITY_REFERENCE = JsonLDObjectReference.to(_EXAMPLE_QUALITY)
 
 
 def convert_to_mldcat_ap(dataset: DatasetMetadata) -> JsonLDGraph:
-    arff_service = DataService(
-        id_="openml-arff-service",
-        title=["OpenML ARFF server"],
-        endpoint_url="https://www.openml.org/data/download",
-    )
-    example_feature = Feature(
-        id_="example-petal-width",
-        name="example_petal_width",
-        feature_type=FeatureType.NUMERIC,
-        description="Feature information not loaded, this is an example.",
-    )
-
-    example_quality = Quality(
-        id_="example-quality",
-        quality_type=QualityType(
-            id_="quality-type-example",
-            name="number_of_features",
-            quality_id="link_to_definition",
-        ),
-        value="150",
-    )
+    # Encodings are cached by `_CacheKey`, which must include every field read here.
     checksum = MD5Checksum(id_="checksum-id", value=dataset.md5_checksum)
     # contributor and creator N/A
     distribution = Distribution(
         id_="distribution-id",
         access_url=[f"https://www.openml.org/d/{dataset.id_}"],
-        has_feature=[JsonLDObjectReference[Feature].to(example_feature)],
-        has_quality=[JsonLDObjectReference[Quality].to(example_quality)],
+        has_feature=[_EXAMPLE_FEATURE_REFERENCE],
+        has_quality=[_EXAMPLE_QUALITY_REFERENCE],
         default_target_attribute=dataset.default_target_attribute,
         download_url=[dataset.url],
         format_=dataset.format_,
-        checksum=JsonLDObjectReference[MD5Checksum].to(checksum),
-        access_service=[JsonLDObjectReference[DataService].to(arff_service)],
+        checksum=JsonLDObjectReference.to(checksum),
+        access_service=[_ARFF_SERVICE_REFERENCE],
     )
 
     mldcat_dataset = Dataset(
         id_=str(dataset.id_),
-        type_="Dataset",
         collection_date=str(dataset.upload_date),
         description=[dataset.description],
         title=[dataset.name],
-        distribution=[JsonLDObjectReference[Distribution].to(distribution)],
+        distribution=[JsonLDObjectReference.to(distribution)],
         status=dataset.status,
         version_info=str(dataset.version),
         version_label=dataset.version_label,
         visibility=dataset.visibility,
-        keyword=dataset.tags,
+        keyword=[*dataset.tags],
         issued=JsonLDQualifiedLiteral(
             value=str(dataset.upload_date),
-            type_="http://www.w3.org/2001/XMLSchema#dateTime",
+            type_=XSD_DATETIME,
         ),
     )
 
     return JsonLDGraph(
-        context="https://semiceu.github.io/MLDCAT-AP/releases/1.0.0/context/mldcat-ap.jsonld",
+        context=MLDCAT_AP_CONTEXT,
         graph=[
-            arff_service,
+            _ARFF_SERVICE,
             distribution,
             mldcat_dataset,
-            example_feature,
-            example_quality,
+            _EXAMPLE_FEATURE,
+            _EXAMPLE_QUALITY,
             checksum,
         ],
     )
+
+
+class MediaType(StrEnum):
+    JSON_LD = "application/ld+json"
+    MSGPACK = "application/msgpack"
+
+
+_json_encoder = msgspec.json.Encoder()
+_msgpack_encoder = msgspec.msgpack.Encoder()
+
+# Every graph has the same context, so its JSON is encoded once and only the
+# `@graph` array is encoded per dataset.
+_JSON_LD_GRAPH_PREFIX = b"".join(
+    [b'{"@context":', _json_encoder.encode(MLDCAT_AP_CONTEXT), b',"@graph":'],
+)
+_JSON_LD_GRAPH_SUFFIX = b"}"
+
+
+@dataclasses.dataclass(frozen=True)
+class _CacheKey:
+    """Identifies a dataset by the metadata `convert_to_mldcat_ap` reads."""
+
+    key: tuple[Hashable, ...]
+    dataset: DatasetMetadata = dataclasses.field(compare=False, hash=False)
+
+    @classmethod
+    def of(cls, dataset: DatasetMetadata) -> _CacheKey:
+        key = (
+            dataset.id_,
+            dataset.version,
+            dataset.version_label,
+            dataset.name,
+            dataset.description,
+            dataset.status,
+            dataset.visibility,
+            dataset.upload_date,
+            dataset.url,
+            dataset.format_,
+            dataset.default_target_attribute,
+            dataset.md5_checksum,
+            tuple(dataset.tags),
+        )
+        return cls(key=key, dataset=dataset)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_mldcat_ap(cache_key: _CacheKey, media_type: MediaType) -> bytes:
+    graph = convert_to_mldcat_ap(cache_key.dataset)
+    if media_type == MediaType.MSGPACK:
+        return _msgpack_encoder.encode(graph)
+    return b"".join(
+        [_JSON_LD_GRAPH_PREFIX, _json_encoder.encode(graph.graph), _JSON_LD_GRAPH_SUFFIX],
+    )
+
+
+def encode_mldcat_ap(dataset: DatasetMetadata, media_type: MediaType = MediaType.JSON_LD) -> bytes:
+    """Return `dataset` as MLDCAT-AP in `media_type`, reusing encodings of unchanged datasets.
+
+    Any change to the metadata used in the conversion leads to a new encoding,
+    `_encode_mldcat_ap.cache_clear()` discards all stored encodings.
+    """
+    return _encode_mldcat_ap(_CacheKey.of(dataset), media_type)
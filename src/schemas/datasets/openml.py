@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import StrEnum
+from typing import Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
 
 
 class DatasetFileFormat(StrEnum):
@@ -24,82 +25,88 @@ class DatasetStatus(StrEnum):
     IN_PREPARATION = "in_preparation"
 
 
+# Pydantic validates literals with less overhead than enums, so `DatasetMetadata` is
+# annotated with the enum values. The enums remain for use in code.
+DatasetFileFormatValue = Literal["arff", "sparse_arff", "parquet"]
+VisibilityValue = Literal["public", "private"]
+DatasetStatusValue = Literal["active", "deactivated", "in processing", "in_preparation"]
+
+
 class DatasetMetadata(BaseModel):
-    id_: int = Field(json_schema_extra={"example": 1}, alias="id")
-    visibility: Visibility = Field(json_schema_extra={"example": Visibility.PUBLIC})
-    status: DatasetStatus = Field(json_schema_extra={"example": DatasetStatus.ACTIVE})
+    id_: int = Field(alias="id")
+    visibility: VisibilityValue
+    status: DatasetStatusValue
 
-    name: str = Field(json_schema_extra={"example": "Anneal"})
-    licence: str = Field(json_schema_extra={"example": "CC0"})
-    version: int = Field(json_schema_extra={"example": 2})
+    name: str
+    licence: str
+    version: int
     version_label: str = Field(
-        json_schema_extra={
-            "example": 2,
-            "description": "Not sure how this relates to `version`.",
-        },
+        json_schema_extra={"description": "Not sure how this relates to `version`."},
     )
-    language: str = Field(json_schema_extra={"example": "English"})
+    language: str
 
-    creators: list[str] = Field(
-        json_schema_extra={"example": ["David Sterling", "Wray Buntine"]},
-        alias="creator",
-    )
-    contributors: list[str] = Field(
-        json_schema_extra={"example": ["David Sterling", "Wray Buntine"]},
-        alias="contributor",
-    )
-    citation: str = Field(
-        json_schema_extra={"example": "https://archive.ics.uci.edu/ml/citation_policy.html"},
-    )
-    paper_url: HttpUrl | None = Field(
-        json_schema_extra={
-            "example": "http://digital.library.adelaide.edu.au/dspace/handle/2440/15227",
-        },
-    )
-    upload_date: datetime = Field(json_schema_extra={"example": datetime(2014, 4, 6, 23, 19, 20)})
-    processing_date: datetime | None = Field(
-        json_schema_extra={"example": datetime(2019, 7, 9, 15, 22, 3)},
-    )
-    processing_error: str | None = Field(
-        json_schema_extra={"example": "Please provide description XML."},
-        alias="error",
-    )
+    creators: list[str] = Field(alias="creator")
+    contributors: list[str] = Field(alias="contributor")
+    citation: str
+    paper_url: str | None
+    upload_date: datetime
+    processing_date: datetime | None
+    processing_error: str | None = Field(alias="error")
     processing_warning: str | None = Field(alias="warning")
-    collection_date: str | None = Field(json_schema_extra={"example": "1990"})
+    collection_date: str | None
 
-    description: str = Field(
-        json_schema_extra={"example": "The original Annealing dataset from UCI."},
-    )
-    description_version: int = Field(json_schema_extra={"example": 2})
-    tags: list[str] = Field(json_schema_extra={"example": ["study_1", "uci"]}, alias="tag")
-    default_target_attribute: str | None = Field(json_schema_extra={"example": "class"})
-    ignore_attribute: list[str] | None = Field(json_schema_extra={"example": "sensitive_feature"})
-    row_id_attribute: list[str] | None = Field(json_schema_extra={"example": "ssn"})
-
-    url: HttpUrl = Field(
-        json_schema_extra={
-            "example": "https://www.openml.org/data/download/1/dataset_1_anneal.arff",
-            "description": "URL of the main dataset data file.",
-        },
-    )
-    parquet_url: HttpUrl | None = Field(
-        json_schema_extra={
-            "example": "http://openml1.win.tue.nl/dataset2/dataset_2.pq",
-            "description": "URL of the parquet dataset data file.",
-        },
+    description: str
+    description_version: int
+    tags: list[str] = Field(alias="tag")
+    default_target_attribute: str | None
+    ignore_attribute: list[str] | None
+    row_id_attribute: list[str] | None
+
+    url: str = Field(json_schema_extra={"description": "URL of the main dataset data file."})
+    parquet_url: str | None = Field(
+        json_schema_extra={"description": "URL of the parquet dataset data file."},
     )
-    minio_url: HttpUrl | None = Field(
-        json_schema_extra={
-            "example": "http://openml1.win.tue.nl/dataset2/dataset_2.pq",
-            "description": "Deprecated, I think.",
+    minio_url: str | None = Field(json_schema_extra={"description": "Deprecated, I think."})
+    file_id: int
+    format_: DatasetFileFormatValue = Field(alias="format")
+    original_data_url: list[str] | None
+    md5_checksum: str
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "id": 1,
+                    "visibility": Visibility.PUBLIC,
+                    "status": DatasetStatus.ACTIVE,
+                    "name": "Anneal",
+                    "licence": "CC0",
+                    "version": 2,
+                    "version_label": "2",
+                    "language": "English",
+                    "creator": ["David Sterling", "Wray Buntine"],
+                    "contributor": ["David Sterling", "Wray Buntine"],
+                    "citation": "https://archive.ics.uci.edu/ml/citation_policy.html",
+                    "paper_url": "http://digital.library.adelaide.edu.au/dspace/handle/2440/15227",
+                    "upload_date": "2014-04-06T23:19:20",
+                    "processing_date": "2019-07-09T15:22:03",
+                    "error": "Please provide description XML.",
+                    "warning": None,
+                    "collection_date": "1990",
+                    "description": "The original Annealing dataset from UCI.",
+                    "description_version": 2,
+                    "tag": ["study_1", "uci"],
+                    "default_target_attribute": "class",
+                    "ignore_attribute": ["sensitive_feature"],
+                    "row_id_attribute": ["ssn"],
+                    "url": "https://www.openml.org/data/download/1/dataset_1_anneal.arff",
+                    "parquet_url": "http://openml1.win.tue.nl/dataset2/dataset_2.pq",
+                    "minio_url": "http://openml1.win.tue.nl/dataset2/dataset_2.pq",
+                    "file_id": 1,
+                    "format": DatasetFileFormat.ARFF,
+                    "original_data_url": ["https://www.openml.org/d/2"],
+                    "md5_checksum": "d01f6ccd68c88b749b20bbe897de3713",
+                },
+            ],
         },
-    )
-    file_id: int = Field(json_schema_extra={"example": 1})
-    format_: DatasetFileFormat = Field(
-        json_schema_extra={"example": DatasetFileFormat.ARFF},
-        alias="format",
-    )
-    original_data_url: list[HttpUrl] | None = Field(
-        json_schema_extra={"example": "https://www.openml.org/d/2"},
-    )
-    md5_checksum: str = Field(json_schema_extra={"example": "d01f6ccd68c88b749b20bbe897de3713"})
+    }
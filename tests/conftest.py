@@ -1,27 +1,63 @@
-import json
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any
 
+import msgspec
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from schemas.datasets.openml import DatasetMetadata
 
 
-@pytest.fixture()
-def api_client() -> Generator[FastAPI, None, None]:
+@pytest.fixture(scope="session")
+def api_client() -> TestClient:
     # We want to avoid starting a test client app if tests don't need it.
     from main import app
 
     return TestClient(app)
 
 
-@pytest.fixture()
-def dataset_130() -> Generator[dict[str, Any], None, None]:
+@pytest.fixture(scope="session")
+def dataset_130() -> dict[str, Any]:
     json_path = Path(__file__).parent / "resources" / "datasets" / "dataset_130.json"
-    with json_path.open("r") as dataset_file:
-        yield json.load(dataset_file)
+    return msgspec.json.decode(json_path.read_bytes(), type=dict[str, Any])
 
 
 @pytest.fixture()
 def default_configuration_file() -> Path:
     return Path().parent.parent / "src" / "config.toml"
+
+
+@pytest.fixture()
+def dataset_metadata() -> DatasetMetadata:
+    return DatasetMetadata.model_construct(
+        id_=130,
+        visibility="private",
+        status="active",
+        name="iris",
+        licence="Public",
+        version=2,
+        version_label="1",
+        language="",
+        creators=["R.A. Fisher"],
+        contributors=[],
+        citation="",
+        upload_date=datetime(2014, 4, 6, 23, 23, 39),
+        processing_date=datetime(2022, 11, 24, 20, 54, 14),
+        processing_warning=None,
+        processing_error=None,
+        description="",
+        description_version=1,
+        tags=["study_1"],
+        default_target_attribute="class",
+        ignore_attribute=[],
+        row_id_attribute=[],
+        url="https://test.openml.org/data/v1/download/130/iris.arff",
+        parquet_url="https://openml1.win.tue.nl/dataset130/dataset_130.pq",
+        minio_url="https://openml1.win.tue.nl/dataset130/dataset_130.pq",
+        file_id=130,
+        format_="arff",
+        paper_url=None,
+        original_data_url=["https://archive.ics.uci.edu/ml/datasets/Iris"],
+        collection_date="1936",
+        md5_checksum="ad484452702105cbf3d30f8deaba39a9",
+    )
@@ -1,56 +1,161 @@
+import asyncio
 import http.client
 import json.decoder
+import os
+from pathlib import Path
 from typing import Any, cast
 
 import httpx
+import msgspec
 import pytest
 from fastapi import FastAPI
 
+DATASET_IDS = range(1, 132)
+PHP_RESPONSE_CACHE = Path(__file__).parent / ".cache" / "php"
+
+
+def _canonical_json(value: Any) -> bytes:
+    return msgspec.json.encode(value, order="sorted")
+
+
+async def _fetch_php_responses(dataset_ids: list[int]) -> dict[int, httpx.Response]:
+    # Bound the number of concurrent requests so the PHP server is not overwhelmed.
+    semaphore = asyncio.Semaphore(16)
+    async with httpx.AsyncClient(
+        base_url="http://server-api-php-api-1:80",
+        limits=httpx.Limits(max_keepalive_connections=16),
+    ) as client:
+
+        async def fetch(dataset_id: int) -> httpx.Response:
+            async with semaphore:
+                return await client.get(f"/api/v1/json/data/{dataset_id}")
+
+        responses = await asyncio.gather(*(fetch(dataset_id) for dataset_id in dataset_ids))
+    return dict(zip(dataset_ids, responses, strict=True))
+
+
+def _is_json_success(response: httpx.Response) -> bool:
+    """Whether `response` is a dataset description, and not a (PHP) error."""
+    if response.status_code != http.client.OK:
+        return False
+    try:
+        content = msgspec.json.decode(response.content)
+    except msgspec.DecodeError:
+        return False
+    description = content.get("data_set_description") if isinstance(content, dict) else None
+    return isinstance(description, dict) and "div" not in description
+
+
+class _CachedResponse(msgspec.Struct):
+    status_code: int
+    text: str
+
+
+def _load_php_responses(dataset_ids: list[int]) -> dict[int, httpx.Response]:
+    """Responses of the PHP server for `dataset_ids`, missing ones are fetched concurrently.
+
+    Responses are stored in `PHP_RESPONSE_CACHE` and reused by later test runs,
+    remove the directory to request them from the PHP server again.
+    """
+    PHP_RESPONSE_CACHE.mkdir(parents=True, exist_ok=True)
+    cached = {
+        dataset_id: msgspec.json.decode(path.read_bytes(), type=_CachedResponse)
+        for dataset_id in dataset_ids
+        if (path := PHP_RESPONSE_CACHE / f"{dataset_id}.json").exists()
+    }
+    missing = [dataset_id for dataset_id in dataset_ids if dataset_id not in cached]
+    fetched = asyncio.run(_fetch_php_responses(missing)) if missing else {}
+    for dataset_id, response in fetched.items():
+        cached[dataset_id] = _CachedResponse(response.status_code, response.text)
+        # Errors may be transient, only store successful JSON responses for later runs.
+        if not _is_json_success(response):
+            continue
+        # Write then rename, so parallel test workers never read a partial file.
+        path = PHP_RESPONSE_CACHE / f"{dataset_id}.json"
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        partial.write_bytes(msgspec.json.encode(cached[dataset_id]))
+        partial.replace(path)
+    return {
+        dataset_id: httpx.Response(response.status_code, content=response.text.encode())
+        for dataset_id, response in cached.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def php_responses(request: pytest.FixtureRequest) -> dict[int, httpx.Response]:
+    """PHP responses for the selected comparison tests, fetched up front.
+
+    Only ids of tests selected in this session are fetched, e.g. respecting `-k`.
+    Under pytest-xdist each worker runs an unknown subset of the tests, so nothing is
+    prefetched and `php_response` fetches the responses of the tests a worker runs.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return {}
+    selected: set[int] = {
+        cast(int, item.callspec.params["dataset_id"])
+        for item in request.session.items
+        if isinstance(item, pytest.Function) and "php_response" in item.fixturenames
+    }
+    return _load_php_responses(sorted(selected))
+
+
+@pytest.fixture()
+def php_response(dataset_id: int, php_responses: dict[int, httpx.Response]) -> httpx.Response:
+    if dataset_id not in php_responses:
+        php_responses.update(_load_php_responses([dataset_id]))
+    return php_responses[dataset_id]
+
+
+def _normalize_php_description(description: dict[str, Any]) -> dict[str, Any]:
+    """Undo differences with the PHP response which the new API does not recreate."""
+    normalized = dict(description)
+    # The new API has normalized `format` field:
+    normalized["format"] = description["format"].lower()
+
+    # There is odd behavior in the live server that I don't want to recreate:
+    # when the creator is a list of csv names, it can either be a str or a list
+    # depending on whether the names are quoted. E.g.:
+    # '"Alice", "Bob"' -> ["Alice", "Bob"]
+    # 'Alice, Bob' -> 'Alice, Bob'
+    creator = description.get("creator")
+    if isinstance(creator, str) and len(names := creator.split(",")) > 1:
+        normalized["creator"] = [name.strip() for name in names]
+    return normalized
+
 
 @pytest.mark.web()
-@pytest.mark.parametrize(
-    "dataset_id",
-    range(1, 132),
-)
-def test_dataset_response_is_identical(dataset_id: int, api_client: FastAPI) -> None:
-    original = httpx.get(f"http://server-api-php-api-1:80/api/v1/json/data/{dataset_id}")
+@pytest.mark.parametrize("dataset_id", DATASET_IDS)
+def test_dataset_response_is_identical(
+    dataset_id: int,
+    api_client: FastAPI,
+    php_response: httpx.Response,
+) -> None:
     new = cast(httpx.Response, api_client.get(f"/old/datasets/{dataset_id}"))
-    assert original.status_code == new.status_code
+    assert php_response.status_code == new.status_code
     assert new.json()
 
     if new.status_code != http.client.OK:
-        assert original.json()["error"] == new.json()["detail"]
+        assert php_response.json()["error"] == new.json()["detail"]
         return
 
     assert "data_set_description" in new.json()
 
     try:
-        original = original.json()["data_set_description"]
+        original = php_response.json()["data_set_description"]
     except json.decoder.JSONDecodeError:
         pytest.skip("A PHP error occurred on the test server.")
 
-    new = new.json()["data_set_description"]
+    new_description = new.json()["data_set_description"]
 
     if "div" in original:
         pytest.skip("A PHP error occurred on the test server.")
 
-    # The new API has normalized `format` field:
-    original["format"] = original["format"].lower()
+    original_description = _normalize_php_description(original)
 
-    # There is odd behavior in the live server that I don't want to recreate:
-    # when the creator is a list of csv names, it can either be a str or a list
-    # depending on whether the names are quoted. E.g.:
-    # '"Alice", "Bob"' -> ["Alice", "Bob"]
-    # 'Alice, Bob' -> 'Alice, Bob'
-    if (
-        "creator" in original
-        and isinstance(original["creator"], str)
-        and len(original["creator"].split(",")) > 1
-    ):
-        original["creator"] = [name.strip() for name in original["creator"].split(",")]
-
-    # The remainder of the fields should be identical:
-    assert original == new
+    # The remainder of the fields should be identical. Comparing canonical encodings is
+    # cheap, only on a mismatch do we compare the dictionaries for a readable diff.
+    if _canonical_json(original_description) != _canonical_json(new_description):
+        assert original_description == new_description
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,71 @@
+import http.client
+from collections.abc import Iterator
+from typing import Any, cast
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_openapi_schema_is_served(api_client: TestClient) -> None:
+    # Importing the app loads the database engines, only do so when needed.
+    from main import app
+
+    response = cast(httpx.Response, api_client.get("/openapi.json"))
+    assert response.status_code == http.client.OK
+    assert response.json()["paths"] == app.openapi()["paths"]
+
+
+def _resolve(schema: dict[str, Any], reference: str) -> Any:
+    """Follow a local JSON pointer `reference`, e.g. '#/components/schemas/Dataset'."""
+    node: Any = schema
+    for token in reference.removeprefix("#/").split("/"):
+        node = node[token.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+def _references(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _references(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _references(item)
+
+
+def test_openapi_schema_references_resolve(api_client: TestClient) -> None:
+    schema = cast(httpx.Response, api_client.get("/openapi.json")).json()
+    references = set(_references(schema))
+
+    assert "#/components/schemas/JsonLDGraph" in references
+    for reference in references:
+        assert reference.startswith("#/")
+        assert _resolve(schema, reference) is not None
+
+
+@pytest.mark.parametrize("path", ["/docs", "/redoc"])
+def test_documentation_is_served(api_client: TestClient, path: str) -> None:
+    response = cast(httpx.Response, api_client.get(path))
+    assert response.status_code == http.client.OK
+    assert "/openapi.json" in response.text
+
+
+def test_swagger_ui_oauth2_redirect_is_served(api_client: TestClient) -> None:
+    response = cast(httpx.Response, api_client.get("/docs/oauth2-redirect"))
+    assert response.status_code == http.client.OK
+
+
+def test_documentation_respects_root_path() -> None:
+    from main import app
+
+    client = TestClient(app, root_path="/api")
+    docs = cast(httpx.Response, client.get("/docs"))
+    assert docs.status_code == http.client.OK
+    assert "/api/openapi.json" in docs.text
+    assert "/api/docs/oauth2-redirect" in docs.text
+
+    schema = cast(httpx.Response, client.get("/openapi.json")).json()
+    assert schema["servers"][0] == {"url": "/api"}
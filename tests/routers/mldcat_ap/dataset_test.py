@@ -0,0 +1,64 @@
+import http.client
+from typing import cast
+
+import httpx
+import msgspec
+import pytest
+from fastapi.testclient import TestClient
+from schemas.datasets.mldcat_ap import MediaType
+from schemas.datasets.openml import DatasetMetadata
+
+
+@pytest.mark.parametrize(
+    ("accept", "media_type"),
+    [
+        (None, MediaType.JSON_LD),
+        ("*/*", MediaType.JSON_LD),
+        ("application/ld+json", MediaType.JSON_LD),
+        ("application/msgpack", MediaType.MSGPACK),
+        ("Application/MsgPack", MediaType.MSGPACK),
+        ("application/msgpack;q=0", MediaType.JSON_LD),
+        ("application/msgpack; q=0.5, */*", MediaType.JSON_LD),
+        ("application/msgpack, application/ld+json;q=0.9", MediaType.MSGPACK),
+        ("application/ld+json;q=0.5, application/msgpack;q=0.5", MediaType.MSGPACK),
+        ("application/msgpack;q=invalid", MediaType.JSON_LD),
+        ("application/json, application/msgpack;q=0.5", MediaType.JSON_LD),
+        ("application/json;q=1, application/msgpack;q=0.1", MediaType.JSON_LD),
+        ("application/json;q=0.5, application/msgpack", MediaType.MSGPACK),
+    ],
+)
+def test_negotiate_media_type(accept: str | None, media_type: MediaType) -> None:
+    # Importing the router loads the database engines, only do so when needed.
+    from routers.mldcat_ap.dataset import _negotiate_media_type
+
+    assert _negotiate_media_type(accept) == media_type
+
+
+@pytest.mark.parametrize(
+    ("accept", "media_type"),
+    [
+        ("application/ld+json", MediaType.JSON_LD),
+        ("application/msgpack", MediaType.MSGPACK),
+    ],
+)
+def test_get_mldcat_ap_dataset_content_type(
+    api_client: TestClient,
+    dataset_metadata: DatasetMetadata,
+    monkeypatch: pytest.MonkeyPatch,
+    accept: str,
+    media_type: MediaType,
+) -> None:
+    monkeypatch.setattr("routers.mldcat_ap.dataset.get_dataset", lambda _: dataset_metadata)
+    response = cast(
+        httpx.Response,
+        api_client.get("/mldcat_ap/datasets/130", headers={"Accept": accept}),
+    )
+
+    assert response.status_code == http.client.OK
+    assert response.headers["content-type"] == media_type
+    assert response.headers["vary"] == "Accept"
+    if media_type == MediaType.MSGPACK:
+        graph = msgspec.msgpack.decode(response.content)
+    else:
+        graph = msgspec.json.decode(response.content)
+    assert graph["@graph"]
@@ -0,0 +1,62 @@
+from typing import Any
+
+import msgspec
+import pytest
+from schemas.datasets.mldcat_ap import (
+    MLDCAT_AP_CONTEXT,
+    MediaType,
+    convert_to_mldcat_ap,
+    encode_mldcat_ap,
+)
+from schemas.datasets.openml import DatasetMetadata
+
+
+def test_encode_mldcat_ap_json_ld_matches_graph(dataset_metadata: DatasetMetadata) -> None:
+    expected = msgspec.json.encode(convert_to_mldcat_ap(dataset_metadata))
+    assert encode_mldcat_ap(dataset_metadata) == expected
+
+
+def test_encode_mldcat_ap_msgpack_matches_json_ld(dataset_metadata: DatasetMetadata) -> None:
+    json_ld = encode_mldcat_ap(dataset_metadata, MediaType.JSON_LD)
+    msgpack = encode_mldcat_ap(dataset_metadata, MediaType.MSGPACK)
+    assert msgspec.msgpack.decode(msgpack) == msgspec.json.decode(json_ld)
+
+
+def test_encode_mldcat_ap_uses_json_ld_keys(dataset_metadata: DatasetMetadata) -> None:
+    encoded = msgspec.json.decode(encode_mldcat_ap(dataset_metadata))
+    graph = {node["@type"]: node for node in encoded["@graph"]}
+
+    assert encoded["@context"] == MLDCAT_AP_CONTEXT
+    expected_types = {"DataService", "Distribution", "Dataset", "Feature", "Quality", "Checksum"}
+    assert set(graph) == expected_types
+    assert all("@id" in node for node in graph.values())
+    assert graph["Checksum"]["checksumValue"] == dataset_metadata.md5_checksum
+    assert graph["Distribution"]["accessUrl"] == ["https://www.openml.org/d/130"]
+    assert graph["Distribution"]["checksum"] == {"@id": graph["Checksum"]["@id"]}
+    assert "type_" not in encoded
+    assert not any("type_" in node for node in graph.values())
+
+
+def test_encode_mldcat_ap_reuses_encoding(dataset_metadata: DatasetMetadata) -> None:
+    first = encode_mldcat_ap(dataset_metadata)
+    assert encode_mldcat_ap(dataset_metadata.model_copy()) is first
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("status", "deactivated"),
+        ("visibility", "public"),
+        ("name", "iris-renamed"),
+        ("tags", ["study_1", "uci"]),
+        ("md5_checksum", "00000000000000000000000000000000"),
+    ],
+)
+def test_encode_mldcat_ap_changes_with_converted_field(
+    dataset_metadata: DatasetMetadata,
+    field: str,
+    value: Any,
+) -> None:
+    changed = dataset_metadata.model_copy(update={field: value})
+    assert encode_mldcat_ap(changed) == msgspec.json.encode(convert_to_mldcat_ap(changed))
+    assert encode_mldcat_ap(changed) != encode_mldcat_ap(dataset_metadata)
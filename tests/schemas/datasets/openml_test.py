@@ -0,0 +1,24 @@
+from enum import StrEnum
+from typing import Any, get_args
+
+import pytest
+from schemas.datasets.openml import (
+    DatasetFileFormat,
+    DatasetFileFormatValue,
+    DatasetStatus,
+    DatasetStatusValue,
+    Visibility,
+    VisibilityValue,
+)
+
+
+@pytest.mark.parametrize(
+    ("enum", "literal"),
+    [
+        (DatasetFileFormat, DatasetFileFormatValue),
+        (Visibility, VisibilityValue),
+        (DatasetStatus, DatasetStatusValue),
+    ],
+)
+def test_literal_values_match_enum(enum: type[StrEnum], literal: Any) -> None:
+    assert get_args(literal) == tuple(member.value for member in enum)